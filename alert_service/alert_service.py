@@ -2,25 +2,36 @@ import asyncio
 import logging
 import time
 import traceback
-from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread
 
 import config
-import pykeybasebot.types.chat1 as chat1
 import redis
 import requests
-from pykeybasebot import Bot
+
+REQUEST_TIMEOUT = 30
+WARM_UP_TIMEOUT = 60
+WARM_UP_REQUEST_TIMEOUT = 5
+STARTUP_KEY = "startup:alert_service"
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 last_sent_alert = time.time()
 last_check = int(time.time())
+startup_time = time.monotonic()
+first_check_done = False
+first_alert_sent = False
+ready = Event()
 
 # Initialize Redis
 redis_client = redis.Redis(
     host=config.REDIS_HOST, port=config.REDIS_PORT, decode_responses=True
 )
 
+# Initialize the HTTP session, the Telegram connection is kept alive
+session = requests.Session()
+
 
 def parse_issue(issue_data: dict) -> dict:
     """Convert Redis issue data from string values to appropriate types."""
@@ -80,35 +91,93 @@ def how_long(ts: int) -> str:
     return "since a few minutes ago"
 
 
+def report_startup(milestone: str) -> None:
+    """Log and store the time elapsed since startup to reach a milestone."""
+    elapsed = round(time.monotonic() - startup_time, 3)
+    logging.info(f"Startup {milestone}: {elapsed}s")
+    try:
+        redis_client.hset(STARTUP_KEY, milestone, elapsed)
+    except redis.RedisError as e:
+        logging.error(f"Failed to store startup {milestone}: {e}")
+
+
 class KeybaseBot:
     """Singleton wrapper for the Keybase bot instance."""
 
     _instance = None
+    _lock = Lock()
 
     @staticmethod
     def get_instance():
-        if KeybaseBot._instance is None:
-            KeybaseBot._instance = Bot(
-                username=config.KEYBASE_BOT_USERNAME,
-                paperkey=config.KEYBASE_BOT_KEY,
-                handler=None,
-            )
+        with KeybaseBot._lock:
+            if KeybaseBot._instance is None:
+                # pykeybasebot is slow to import, load it only when needed
+                from pykeybasebot import Bot
+
+                KeybaseBot._instance = Bot(
+                    username=config.KEYBASE_BOT_USERNAME,
+                    paperkey=config.KEYBASE_BOT_KEY,
+                    handler=None,
+                )
         return KeybaseBot._instance
 
 
+def warm_up_redis() -> None:
+    """Open the Redis connection and clear the previous startup report."""
+    try:
+        redis_client.delete(STARTUP_KEY)
+    except redis.RedisError as e:
+        logging.error(f"Failed to warm up Redis: {e}")
+
+
+def warm_up_keybase() -> None:
+    """Create the Keybase bot and log it in."""
+    try:
+        bot = KeybaseBot.get_instance()
+        asyncio.run(asyncio.wait_for(bot.ensure_initialized(), WARM_UP_TIMEOUT))
+    except Exception as e:
+        logging.error(f"Failed to warm up Keybase: {e}")
+
+
+def warm_up_telegram() -> None:
+    """Open the Telegram connection and check the bot key."""
+    try:
+        url = f"https://api.telegram.org/bot{config.TELEGRAM_BOT_KEY}/getMe"
+        response = session.get(url, timeout=WARM_UP_REQUEST_TIMEOUT)
+        if response.status_code != 200:
+            logging.error(f"Telegram API error: {response.text}")
+    except requests.exceptions.RequestException as e:
+        logging.error(f"Failed to warm up Telegram: {e}")
+
+
+def warm_up() -> None:
+    """Warm up Redis, Keybase and Telegram concurrently."""
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        executor.submit(warm_up_redis)
+        executor.submit(warm_up_keybase)
+        executor.submit(warm_up_telegram)
+    report_startup("warm_up")
+    ready.set()
+
+
 def send_alerts(message: str) -> bool:
     """Sends an alert via Keybase and Telegram."""
-    global last_sent_alert
+    global last_sent_alert, first_alert_sent
     keybase_sent = send_keybase_alert(message)
     telegram_sent = send_telegram_alert(message)
     if keybase_sent or telegram_sent:
         last_sent_alert = time.time()
+        if not first_alert_sent:
+            first_alert_sent = True
+            report_startup("time_to_first_alert")
     return keybase_sent or telegram_sent
 
 
 def send_keybase_alert(message: str) -> bool:
     """Sends an alert via Keybase."""
     try:
+        import pykeybasebot.types.chat1 as chat1
+
         bot = KeybaseBot.get_instance()
         channel = chat1.ChatChannel(**config.KEYBASE_BOT_CHANNEL)
         asyncio.run(bot.chat.send(channel, message))
@@ -124,8 +193,11 @@ def send_telegram_alert(message: str) -> bool:
     try:
         request_data = {"chat_id": config.TELEGRAM_BOT_CHANNEL, "text": message}
         url = f"https://api.telegram.org/bot{config.TELEGRAM_BOT_KEY}/sendMessage"
-        response = requests.post(
-            url, json=request_data, headers={"Content-Type": "application/json"}
+        response = session.post(
+            url,
+            json=request_data,
+            headers={"Content-Type": "application/json"},
+            timeout=REQUEST_TIMEOUT,
         )
         if response.status_code == 200:
             return True
@@ -165,16 +237,24 @@ def handle_unresolved_issue(issue: dict) -> None:
 
 def handle_issue(issue: dict) -> None:
     """Check and process an issue."""
+    handled_at = time.monotonic()
+    previous_alert = last_sent_alert
     if issue["resolved"]:
         handle_resolved_issue(issue)
     elif issue["last_alert"] == 0:
         handle_first_alert_issue(issue)
     else:
         handle_unresolved_issue(issue)
+    if last_sent_alert != previous_alert:
+        latency = round(time.monotonic() - handled_at, 3)
+        logging.info(f"Alert for issue {issue['id']} sent in {latency}s")
 
 
 def main() -> None:
     """Main function to check and process all issues."""
+    global first_check_done
+    if not ready.wait(WARM_UP_TIMEOUT):
+        logging.warning("Warm-up is taking too long, starting checks anyway")
     while True:
         try:
             issues = fetch_issues()
@@ -183,6 +263,9 @@ def main() -> None:
             if not issues and time.time() - last_sent_alert > 24 * 60 * 60:
                 send_alerts("There wasn't any issue in the past 24 hours")
             update_health_status()
+            if not first_check_done:
+                first_check_done = True
+                report_startup("time_to_first_check")
         except Exception as e:
             logging.error(f"Error in alert_service: {e}")
         time.sleep(config.CHECK_INTERVAL)
@@ -190,5 +273,6 @@ def main() -> None:
 
 if __name__ == "__main__":
     logging.info("Starting Alert Service...")
+    Thread(target=warm_up, daemon=True).start()
     alert_thread = Thread(target=main)
     alert_thread.start()
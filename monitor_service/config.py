@@ -1,17 +1,105 @@
 import os
+from dataclasses import dataclass
+from typing import List, Optional
 
-HTTPS_RPC_URLS = os.environ["HTTPS_RPC_URLS"].split(",")
-WSS_RPC_URLS = os.environ["WSS_RPC_URLS"].split(",")
-SEALING_BORDER = int(os.environ["SEALING_BORDER"])
-DEADLOCK_BORDER = int(os.environ["DEADLOCK_BORDER"])
-RELAYER_BALANCE_BORDER = int(os.environ["RELAYER_BALANCE_BORDER"])
-RELAYER_ADDRESS = os.environ["RELAYER_ADDRESS"]
-DISTRIBUTION_BALANCE_BORDER = int(os.environ["DISTRIBUTION_BALANCE_BORDER"])
-DISTRIBUTION_ADDRESS = os.environ["DISTRIBUTION_ADDRESS"]
-IDCHAIN_EXPLORER_URL = os.environ["IDCHAIN_EXPLORER_URL"]
-IDCHAIN_ARAGON_URL = os.environ["IDCHAIN_ARAGON_URL"]
-EIDI_CLAIM_URL = os.environ["EIDI_CLAIM_URL"]
-EIDI_CLAIM_API = os.environ["EIDI_CLAIM_API"]
+
+@dataclass(frozen=True)
+class Network:
+    """Settings of a single monitored network."""
+
+    name: str
+    label: str
+    is_default: bool
+    https_rpc_urls: List[str]
+    wss_rpc_urls: List[str]
+    sealing_border: int
+    deadlock_border: int
+    relayer_balance_border: int
+    relayer_address: str
+    distribution_balance_border: int
+    distribution_address: str
+    explorer_url: str
+    aragon_url: str
+    eidi_claim_url: str
+    eidi_claim_api: str
+    txpool_backlog_border: int
+    relayer_stuck_nonce_border: int
+    relayer_inclusion_delay_border: int
+
+
+def network_env(name: str, key: str, default: Optional[str] = None) -> str:
+    """Read a network setting from its prefixed variable, or use the default."""
+    prefixed_key = f"{name.upper()}_{key}"
+    if prefixed_key in os.environ:
+        return os.environ[prefixed_key]
+    if default is None:
+        raise KeyError(prefixed_key)
+    return default
+
+
+def load_network(name: str, is_default: bool) -> Network:
+    """Load the settings of a network from its prefixed environment variables.
+
+    Thresholds fall back to the unprefixed variables. URLs and addresses only
+    do so for the default network, other networks skip the checks whose URL
+    or address is not set.
+    """
+
+    def threshold(key: str, default: Optional[str] = None) -> int:
+        try:
+            return int(network_env(name, key, os.environ.get(key, default)))
+        except KeyError:
+            raise KeyError(f"{key} (or {name.upper()}_{key})") from None
+
+    def endpoint(key: str) -> str:
+        return network_env(name, key, os.environ.get(key) if is_default else "")
+
+    https_rpc_urls = [
+        url
+        for url in network_env(
+            name, "HTTPS_RPC_URLS", os.environ.get("HTTPS_RPC_URLS") if is_default else None
+        ).split(",")
+        if url
+    ]
+    if not https_rpc_urls:
+        raise ValueError(f"No HTTPS RPC URL set for network {name}")
+
+    return Network(
+        name=name,
+        label=network_env(name, "LABEL", "IDChain" if is_default else name),
+        is_default=is_default,
+        https_rpc_urls=https_rpc_urls,
+        wss_rpc_urls=[url for url in endpoint("WSS_RPC_URLS").split(",") if url],
+        sealing_border=threshold("SEALING_BORDER"),
+        deadlock_border=threshold("DEADLOCK_BORDER"),
+        relayer_balance_border=threshold("RELAYER_BALANCE_BORDER"),
+        relayer_address=endpoint("RELAYER_ADDRESS"),
+        distribution_balance_border=threshold("DISTRIBUTION_BALANCE_BORDER"),
+        distribution_address=endpoint("DISTRIBUTION_ADDRESS"),
+        explorer_url=endpoint("IDCHAIN_EXPLORER_URL"),
+        aragon_url=endpoint("IDCHAIN_ARAGON_URL"),
+        eidi_claim_url=endpoint("EIDI_CLAIM_URL"),
+        eidi_claim_api=endpoint("EIDI_CLAIM_API"),
+        txpool_backlog_border=threshold("TXPOOL_BACKLOG_BORDER", "100"),
+        relayer_stuck_nonce_border=threshold("RELAYER_STUCK_NONCE_BORDER", "300"),
+        relayer_inclusion_delay_border=threshold("RELAYER_INCLUSION_DELAY_BORDER", "120"),
+    )
+
+
+def load_networks() -> List[Network]:
+    """Load the networks listed in NETWORKS, the first one is the default."""
+    names = [name.strip() for name in os.environ.get("NETWORKS", "idchain").split(",")]
+    names = [name for name in names if name]
+    prefixes = [name.upper() for name in names]
+    duplicates = {name for name in names if prefixes.count(name.upper()) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate network names in NETWORKS: {', '.join(duplicates)}")
+    if not names:
+        raise ValueError("NETWORKS does not list any network")
+    return [load_network(name, i == 0) for i, name in enumerate(names)]
+
+
+NETWORKS = load_networks()
 CHECK_INTERVAL = int(os.environ["CHECK_INTERVAL"])
 REDIS_HOST = os.environ["REDIS_HOST"]
 REDIS_PORT = os.environ["REDIS_PORT"]
@@ -1,22 +1,28 @@
 ISSUE_MESSAGES = {
-    "sealer_not_sealing": "⚠️ IDChain node is not sealing blocks.\nNode Address: {}",
-    "sealer_sealing_resolved": "✅ IDChain node sealing issue resolved.\nNode Address: {}",
-    "idchain_locked": "⚠️ IDChain is locked.\nURL: {}",
-    "idchain_lock_resolved": "✅ IDChain lock issue resolved.\nURL: {}",
-    "distribution_low_balance": "⚠️ Distribution contract balance is below the required threshold.\nContract Address: {}",
-    "distribution_balance_resolved": "✅ Distribution contract balance issue resolved.\nContract Address: {}",
-    "relayer_low_balance": "⚠️ Relayer balance is below the required threshold.\nRelayer Address: {}",
-    "relayer_balance_resolved": "✅ Relayer balance issue resolved.\nRelayer Address: {}",
-    "https_endpoint_down": "⚠️ IDChain HTTPS endpoint is unavailable.\nURL: {}",
-    "https_endpoint_resolved": "✅ IDChain HTTPS endpoint issue resolved.\nURL: {}",
-    "wss_endpoint_down": "⚠️ IDChain WSS endpoint is unavailable.\nURL: {}",
-    "wss_endpoint_resolved": "✅ IDChain WSS endpoint issue resolved.\nURL: {}",
-    "explorer_service_down": "⚠️ IDChain explorer service is unavailable.\nURL: {}",
-    "explorer_service_resolved": "✅ IDChain explorer service issue resolved.\nURL: {}",
-    "aragon_service_down": "⚠️ IDChain Aragon service is unavailable.\nURL: {}",
-    "aragon_service_resolved": "✅ IDChain Aragon service issue resolved.\nURL: {}",
-    "claim_page_down": "⚠️ IDChain claim Eidi service is unavailable.\nURL: {}",
-    "claim_page_resolved": "✅ IDChain claim Eidi service issue resolved.\nURL: {}",
-    "claim_api_down": "⚠️ IDChain claim Eidi API is unavailable.\nURL: {}",
-    "claim_api_resolved": "✅ IDChain claim Eidi API issue resolved.\nURL: {}",
+    "sealer_not_sealing": "⚠️ {network} node is not sealing blocks.\nNode Address: {}",
+    "sealer_sealing_resolved": "✅ {network} node sealing issue resolved.\nNode Address: {}",
+    "idchain_locked": "⚠️ {network} is locked.\nURL: {}",
+    "idchain_lock_resolved": "✅ {network} lock issue resolved.\nURL: {}",
+    "distribution_low_balance": "⚠️ {network} distribution contract balance is below the required threshold.\nContract Address: {}",
+    "distribution_balance_resolved": "✅ {network} distribution contract balance issue resolved.\nContract Address: {}",
+    "relayer_low_balance": "⚠️ {network} relayer balance is below the required threshold.\nRelayer Address: {}",
+    "relayer_balance_resolved": "✅ {network} relayer balance issue resolved.\nRelayer Address: {}",
+    "relayer_stuck_nonce": "⚠️ {network} relayer transactions are not being mined.\nRelayer Address: {}\nStuck Nonce: {}",
+    "relayer_stuck_nonce_resolved": "✅ {network} relayer stuck nonce issue resolved.\nRelayer Address: {}",
+    "relayer_slow_inclusion": "⚠️ {network} relayer transactions are slow to be mined.\nRelayer Address: {}\nInclusion Delay: {}s",
+    "relayer_slow_inclusion_resolved": "✅ {network} relayer slow inclusion issue resolved.\nRelayer Address: {}",
+    "txpool_backlog": "⚠️ {network} txpool backlog is above the required threshold.\nPending: {}\nQueued: {}",
+    "txpool_backlog_resolved": "✅ {network} txpool backlog issue resolved.",
+    "https_endpoint_down": "⚠️ {network} HTTPS endpoint is unavailable.\nURL: {}",
+    "https_endpoint_resolved": "✅ {network} HTTPS endpoint issue resolved.\nURL: {}",
+    "wss_endpoint_down": "⚠️ {network} WSS endpoint is unavailable.\nURL: {}",
+    "wss_endpoint_resolved": "✅ {network} WSS endpoint issue resolved.\nURL: {}",
+    "explorer_service_down": "⚠️ {network} explorer service is unavailable.\nURL: {}",
+    "explorer_service_resolved": "✅ {network} explorer service issue resolved.\nURL: {}",
+    "aragon_service_down": "⚠️ {network} Aragon service is unavailable.\nURL: {}",
+    "aragon_service_resolved": "✅ {network} Aragon service issue resolved.\nURL: {}",
+    "claim_page_down": "⚠️ {network} claim Eidi service is unavailable.\nURL: {}",
+    "claim_page_resolved": "✅ {network} claim Eidi service issue resolved.\nURL: {}",
+    "claim_api_down": "⚠️ {network} claim Eidi API is unavailable.\nURL: {}",
+    "claim_api_resolved": "✅ {network} claim Eidi API issue resolved.\nURL: {}",
 }
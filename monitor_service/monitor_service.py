@@ -2,24 +2,111 @@ import hashlib
 import logging
 import time
 import traceback
-from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread
 from typing import Any, Dict, Optional
 
 import config
 import redis
 import requests
-import websocket
+from config import Network
 from messages import ISSUE_MESSAGES
+from requests.adapters import HTTPAdapter
+
+REQUEST_TIMEOUT = 30
+WARM_UP_TIMEOUT = 5
+STARTUP_KEY = "startup:monitor_service"
+
+startup_time = time.monotonic()
+first_check_done = False
+ready = Event()
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
-# Initialize Redis
+# Initialize Redis, issue writes of a cycle are buffered in a single pipeline
 redis_client = redis.Redis(
     host=config.REDIS_HOST, port=config.REDIS_PORT, decode_responses=True
 )
+redis_pipeline = redis_client.pipeline(transaction=False)
+redis_pipeline_lock = Lock()
+
+# Resolved flag of every issue in Redis, loaded once at the start of a cycle
+issues: Dict[str, bool] = {}
+
+# First time each pending relayer nonce was seen and last nonce check, per network
+relayer_nonces: Dict[str, Dict[int, int]] = {}
+relayer_checked_at: Dict[str, int] = {}
+# Last time relayer transactions were slow to be mined, per network
+relayer_slow_at: Dict[str, int] = {}
+
+# Initialize the HTTP session, connections are kept alive across cycles
+session = requests.Session()
+session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=max(10, 4 * len(config.NETWORKS))),
+)
+
+# Networks are checked concurrently, one worker each
+network_executor = ThreadPoolExecutor(max_workers=len(config.NETWORKS))
+
+
+def report_startup(milestone: str) -> None:
+    """Log and store the time elapsed since startup to reach a milestone."""
+    elapsed = round(time.monotonic() - startup_time, 3)
+    logging.info(f"Startup {milestone}: {elapsed}s")
+    try:
+        redis_client.hset(STARTUP_KEY, milestone, elapsed)
+    except redis.RedisError as e:
+        logging.error(f"Failed to store startup {milestone}: {e}")
+
+
+def warm_up_redis() -> None:
+    """Open the Redis connection and clear the previous startup report."""
+    try:
+        redis_client.delete(STARTUP_KEY)
+    except redis.RedisError as e:
+        logging.error(f"Failed to warm up Redis: {e}")
+
+
+def warm_up_url(url: str) -> None:
+    """Open a pooled HTTPS connection to a URL."""
+    try:
+        session.head(url, timeout=WARM_UP_TIMEOUT)
+    except requests.exceptions.RequestException as e:
+        logging.error(f"Failed to warm up {url}: {e}")
+
+
+def warm_up() -> None:
+    """Warm up Redis and the primary RPC connection of every network.
+
+    They are used by most checks, so the first check waits for them, for at
+    most WARM_UP_TIMEOUT, to reuse the pooled connections.
+    """
+    urls = {network.https_rpc_urls[0] for network in config.NETWORKS}
+    with ThreadPoolExecutor(max_workers=len(urls) + 1) as executor:
+        executor.submit(warm_up_redis)
+        for url in urls:
+            executor.submit(warm_up_url, url)
+    report_startup("warm_up")
+    ready.set()
+
+
+def load_issues() -> None:
+    """Load the resolved flag of all issues from Redis."""
+    issue_ids = [key.split(":", 1)[1] for key in redis_client.keys("issue:*")]
+    pipeline = redis_client.pipeline(transaction=False)
+    for issue_id in issue_ids:
+        pipeline.hget(f"issue:{issue_id}", "resolved")
+    issues.clear()
+    issues.update(
+        {
+            issue_id: resolved == str(int(True))
+            for issue_id, resolved in zip(issue_ids, pipeline.execute())
+        }
+    )
 
 
 def insert_new_issue(issue_id: str, message: str) -> None:
@@ -32,33 +119,48 @@ def insert_new_issue(issue_id: str, message: str) -> None:
         "last_alert": 0,
         "alert_number": 0,
     }
-    redis_client.hset(f"issue:{issue_id}", mapping=issue)
+    with redis_pipeline_lock:
+        redis_pipeline.hset(f"issue:{issue_id}", mapping=issue)
+    issues[issue_id] = False
 
 
 def is_issue_exists(issue_id: str) -> bool:
     """Check if an issue exists in Redis."""
-    return redis_client.exists(f"issue:{issue_id}") > 0
+    return issue_id in issues
 
 
 def mark_issue_resolved(issue_id: str, message: str) -> None:
     """Mark an issue as resolved in Redis using a hash structure."""
-    if redis_client.exists(f"issue:{issue_id}"):
-        redis_client.hset(
-            f"issue:{issue_id}", mapping={"resolved": int(True), "message": message}
-        )
+    if issues.get(issue_id) is False:
+        with redis_pipeline_lock:
+            redis_pipeline.hset(
+                f"issue:{issue_id}", mapping={"resolved": int(True), "message": message}
+            )
+        issues[issue_id] = True
 
 
 def update_health_status() -> None:
-    """Update last check timestamp in Redis."""
-    redis_client.set("health:monitor_service", int(time.time()))
+    """Update last check timestamp in Redis and flush the buffered issues."""
+    redis_pipeline.set("health:monitor_service", int(time.time()))
+    redis_pipeline.execute()
+
 
+def generate_issue_id(network: Network, part1: str, part2: str) -> str:
+    """Generate a unique hash for an issue of a network.
 
-def generate_issue_id(part1: str, part2: str) -> str:
-    """Generate a unique hash for an issue."""
-    message = f"{part1}|{part2}".encode("utf-8")
+    Issues of the default network keep their unprefixed ids, so issues opened
+    before multi-network support are still resolved.
+    """
+    message = f"{part1}|{part2}" if network.is_default else f"{network.name}|{part1}|{part2}"
+    message = message.encode("utf-8")
     return hashlib.sha256(message).hexdigest()
 
 
+def issue_message(network: Network, key: str, *args: Any) -> str:
+    """Format an issue message for a network."""
+    return ISSUE_MESSAGES[key].format(*args, network=network.label)
+
+
 def send_rpc_request(
     url: str,
     method: str,
@@ -73,6 +175,8 @@ def send_rpc_request(
     }
     headers = {"content-type": "application/json", "cache-control": "no-cache"}
     response = send_post_request(url, request_data, headers)
+    if response is None:
+        return None
     try:
         return response.json().get("result", None)
     except ValueError as e:
@@ -87,7 +191,9 @@ def send_post_request(
 ) -> Optional[requests.Response]:
     """Send an HTTP request"""
     try:
-        response = requests.post(url, json=request_data, headers=headers)
+        response = session.post(
+            url, json=request_data, headers=headers, timeout=REQUEST_TIMEOUT
+        )
         response.raise_for_status()
         return response
     except requests.exceptions.RequestException as e:
@@ -95,10 +201,10 @@ def send_post_request(
         return None
 
 
-def get_eidi_balance(addr: str) -> float:
+def get_eidi_balance(network: Network, addr: str) -> float:
     """Get the Eidi balance of an Ethereum address."""
     balance = send_rpc_request(
-        url=config.HTTPS_RPC_URLS[0], method="eth_getBalance", params=[addr, "latest"]
+        url=network.https_rpc_urls[0], method="eth_getBalance", params=[addr, "latest"]
     )
     if not balance:
         return None
@@ -109,10 +215,26 @@ def get_eidi_balance(addr: str) -> float:
         return None
 
 
-def check_sealers_activity() -> bool:
-    """Check the activity of sealing nodes on the IDChain network."""
+def get_transaction_count(network: Network, addr: str, block: str) -> Optional[int]:
+    """Get the transaction count (nonce) of an address at the given block tag."""
+    count = send_rpc_request(
+        url=network.https_rpc_urls[0],
+        method="eth_getTransactionCount",
+        params=[addr, block],
+    )
+    if not count:
+        return None
+    try:
+        return int(count, 16)
+    except (ValueError, TypeError) as e:
+        logging.error(f"Failed to parse {block} nonce for address {addr}: {e}. Nonce value: {count}")
+        return None
+
+
+def check_sealers_activity(network: Network) -> bool:
+    """Check the activity of sealing nodes on the network."""
     clique_status = send_rpc_request(
-        url=config.HTTPS_RPC_URLS[0], method="clique_status", params=[]
+        url=network.https_rpc_urls[0], method="clique_status", params=[]
     )
     if not clique_status:
         return False
@@ -121,153 +243,304 @@ def check_sealers_activity() -> bool:
     num_blocks = clique_status.get("numBlocks")
 
     if not num_blocks or not isinstance(num_blocks, int):
-        logging.error(f"Invalid numBlocks value: {num_blocks}")
+        logging.error(f"Invalid numBlocks value on {network.name}: {num_blocks}")
         return False
 
     if not sealer_activity or not isinstance(sealer_activity, dict):
-        logging.error(f"Invalid sealerActivity in clique_status: {sealer_activity}")
+        logging.error(f"Invalid sealerActivity in clique_status on {network.name}: {sealer_activity}")
         return False
 
     sealers_count = len(sealer_activity)
     for sealer, sealed_block in sealer_activity.items():
         check_sealer_activity(
-            sealer, sealed_block, num_blocks, sealers_count
+            network, sealer, sealed_block, num_blocks, sealers_count
         )
     return True
 
 
 def check_sealer_activity(
-    sealer: str, sealed_block: int, num_blocks: int, sealers_count: int
+    network: Network,
+    sealer: str,
+    sealed_block: int,
+    num_blocks: int,
+    sealers_count: int,
 ) -> None:
-    """Check the activity of a sealing node on the IDChain network."""
-    issue_id = generate_issue_id(sealer, "not sealing block")
+    """Check the activity of a sealing node on the network."""
+    issue_id = generate_issue_id(network, sealer, "not sealing block")
     issue_exists = is_issue_exists(issue_id)
     if not issue_exists and sealed_block == 0:
-        insert_new_issue(issue_id, ISSUE_MESSAGES["sealer_not_sealing"].format(sealer))
+        insert_new_issue(
+            issue_id, issue_message(network, "sealer_not_sealing", sealer)
+        )
     elif issue_exists and sealed_block >= min(
-        config.SEALING_BORDER, num_blocks / sealers_count
+        network.sealing_border, num_blocks / sealers_count
     ):
         mark_issue_resolved(
-            issue_id, ISSUE_MESSAGES["sealer_sealing_resolved"].format(sealer)
+            issue_id, issue_message(network, "sealer_sealing_resolved", sealer)
         )
 
 
-def check_idchain_lock() -> bool:
-    """Check if the IDChain network is locked."""
+def check_idchain_lock(network: Network) -> bool:
+    """Check if the network is locked."""
     block = send_rpc_request(
-        url=config.HTTPS_RPC_URLS[0],
+        url=network.https_rpc_urls[0],
         method="eth_getBlockByNumber",
         params=["latest", False],
     )
     if not block:
         return False
 
-    issue_id = generate_issue_id("idchain", "locked")
+    issue_id = generate_issue_id(network, "idchain", "locked")
     issue_exists = is_issue_exists(issue_id)
     try:
         block_timestamp = int(block["timestamp"], 16)
     except ValueError as e:
-        logging.error(f"Invalid block timestamp: {e}")
+        logging.error(f"Invalid block timestamp on {network.name}: {e}")
         return False
 
-    is_active = (time.time() - block_timestamp) < config.DEADLOCK_BORDER
+    is_active = (time.time() - block_timestamp) < network.deadlock_border
     if not is_active and not issue_exists:
         insert_new_issue(
             issue_id,
-            ISSUE_MESSAGES["idchain_locked"].format(config.IDCHAIN_EXPLORER_URL),
+            issue_message(network, "idchain_locked", network.explorer_url),
         )
     elif is_active and issue_exists:
         mark_issue_resolved(
             issue_id,
-            ISSUE_MESSAGES["idchain_lock_resolved"].format(config.IDCHAIN_EXPLORER_URL),
+            issue_message(network, "idchain_lock_resolved", network.explorer_url),
         )
     return True
 
 
-def check_distributor_balance() -> bool:
+def check_distributor_balance(network: Network) -> bool:
     """Check the balance of the distribution contract."""
-    issue_id = generate_issue_id(config.DISTRIBUTION_ADDRESS, "eidi balance")
+    if not network.distribution_address:
+        return True
+
+    issue_id = generate_issue_id(network, network.distribution_address, "eidi balance")
     issue_exists = is_issue_exists(issue_id)
-    balance = get_eidi_balance(config.DISTRIBUTION_ADDRESS)
+    balance = get_eidi_balance(network, network.distribution_address)
     if not balance:
         return False
 
-    low_balance = balance < config.DISTRIBUTION_BALANCE_BORDER
+    low_balance = balance < network.distribution_balance_border
     if low_balance and not issue_exists:
         insert_new_issue(
             issue_id,
-            ISSUE_MESSAGES["distribution_low_balance"].format(
-                config.DISTRIBUTION_ADDRESS
+            issue_message(
+                network, "distribution_low_balance", network.distribution_address
             ),
         )
     elif issue_exists and not low_balance:
         mark_issue_resolved(
             issue_id,
-            ISSUE_MESSAGES["distribution_balance_resolved"].format(
-                config.DISTRIBUTION_ADDRESS
+            issue_message(
+                network, "distribution_balance_resolved", network.distribution_address
             ),
         )
     return True
 
 
-def check_relayer_balance() -> bool:
+def check_relayer_balance(network: Network) -> bool:
     """Check the balance of the relayer address."""
-    issue_id = generate_issue_id(config.RELAYER_ADDRESS, "eidi balance")
+    if not network.relayer_address:
+        return True
+
+    issue_id = generate_issue_id(network, network.relayer_address, "eidi balance")
     issue_exists = is_issue_exists(issue_id)
-    balance = get_eidi_balance(config.RELAYER_ADDRESS)
+    balance = get_eidi_balance(network, network.relayer_address)
     if not balance:
         return False
 
-    low_balance = balance < config.RELAYER_BALANCE_BORDER
+    low_balance = balance < network.relayer_balance_border
     if low_balance and not issue_exists:
         insert_new_issue(
             issue_id,
-            ISSUE_MESSAGES["relayer_low_balance"].format(config.RELAYER_ADDRESS),
+            issue_message(network, "relayer_low_balance", network.relayer_address),
         )
     elif issue_exists and not low_balance:
         mark_issue_resolved(
             issue_id,
-            ISSUE_MESSAGES["relayer_balance_resolved"].format(config.RELAYER_ADDRESS),
+            issue_message(network, "relayer_balance_resolved", network.relayer_address),
+        )
+    return True
+
+
+def check_txpool_backlog(network: Network) -> bool:
+    """Check the number of pending and queued transactions in the txpool."""
+    txpool_status = send_rpc_request(
+        url=network.https_rpc_urls[0], method="txpool_status", params=[]
+    )
+    if not txpool_status:
+        return False
+
+    try:
+        pending = int(txpool_status["pending"], 16)
+        queued = int(txpool_status["queued"], 16)
+    except (KeyError, ValueError, TypeError) as e:
+        logging.error(f"Invalid txpool_status on {network.name}: {txpool_status}. {e}")
+        return False
+
+    issue_id = generate_issue_id(network, "idchain", "txpool backlog")
+    issue_exists = is_issue_exists(issue_id)
+    backlogged = pending + queued > network.txpool_backlog_border
+    if backlogged and not issue_exists:
+        insert_new_issue(
+            issue_id, issue_message(network, "txpool_backlog", pending, queued)
         )
+    elif issue_exists and not backlogged:
+        mark_issue_resolved(issue_id, issue_message(network, "txpool_backlog_resolved"))
     return True
 
 
-def check_https_endpoints() -> bool:
-    """Check the health of IDChain HTTPS endpoints."""
-    for endpoint in config.HTTPS_RPC_URLS:
-        issue_id = generate_issue_id(endpoint, "idchain https endpoint")
+def check_relayer_nonce(network: Network) -> bool:
+    """Check the nonce progression and inclusion delay of relayer transactions.
+
+    The first time each pending nonce is seen is kept in memory. A nonce that
+    has dropped below the latest nonce has been mined, so its age at the
+    previous check is the inclusion delay (accurate to one CHECK_INTERVAL),
+    and the age of the latest nonce while it is still pending is how long the
+    relayer has been stuck.
+    """
+    if not network.relayer_address:
+        return True
+
+    latest = get_transaction_count(network, network.relayer_address, "latest")
+    pending = get_transaction_count(network, network.relayer_address, "pending")
+    if latest is None or pending is None:
+        return False
+
+    now = int(time.time())
+    first_seen = relayer_nonces.setdefault(network.name, {})
+    checked_at = relayer_checked_at.get(network.name, now)
+    # Mined nonces were last seen pending at the previous check, counting up to
+    # it keeps gaps between checks out of the inclusion delay
+    inclusion_delay = max(
+        (checked_at - first_seen[nonce] for nonce in first_seen if nonce < latest),
+        default=None,
+    )
+    for nonce in list(first_seen):
+        if nonce < latest or nonce >= pending:
+            del first_seen[nonce]
+    for nonce in range(latest, pending):
+        first_seen.setdefault(nonce, now)
+    relayer_checked_at[network.name] = now
+
+    stuck_age = now - first_seen.get(latest, now)
+    check_relayer_inclusion_delay(network, inclusion_delay, stuck_age)
+    check_relayer_stuck_nonce(network, latest, stuck_age)
+    return True
+
+
+def check_relayer_stuck_nonce(network: Network, nonce: int, stuck_age: int) -> None:
+    """Check how long the next relayer nonce has been waiting to be mined."""
+    issue_id = generate_issue_id(network, network.relayer_address, "stuck nonce")
+    issue_exists = is_issue_exists(issue_id)
+    stuck = stuck_age > network.relayer_stuck_nonce_border
+    if stuck and not issue_exists:
+        insert_new_issue(
+            issue_id,
+            issue_message(
+                network, "relayer_stuck_nonce", network.relayer_address, nonce
+            ),
+        )
+    elif issue_exists and not stuck:
+        mark_issue_resolved(
+            issue_id,
+            issue_message(
+                network, "relayer_stuck_nonce_resolved", network.relayer_address
+            ),
+        )
+
+
+def check_relayer_inclusion_delay(
+    network: Network, inclusion_delay: Optional[int], pending_age: int
+) -> None:
+    """Check the inclusion delay of relayer transactions.
+
+    The issue opens when a transaction mined since the previous check was
+    slow or a pending one is already overdue. It resolves once a transaction
+    is mined within the border, or after the border has passed without any
+    slow transaction.
+    """
+    issue_id = generate_issue_id(network, network.relayer_address, "inclusion delay")
+    issue_exists = is_issue_exists(issue_id)
+    border = network.relayer_inclusion_delay_border
+    now = int(time.time())
+    delay = max(inclusion_delay or 0, pending_age)
+    slow = delay > border
+    if slow:
+        relayer_slow_at[network.name] = now
+
+    if slow and not issue_exists:
+        insert_new_issue(
+            issue_id,
+            issue_message(
+                network,
+                "relayer_slow_inclusion",
+                network.relayer_address,
+                delay,
+            ),
+        )
+    elif issue_exists and not slow:
+        mined_in_time = inclusion_delay is not None
+        held_down = now - relayer_slow_at.setdefault(network.name, now) >= border
+        if mined_in_time or held_down:
+            mark_issue_resolved(
+                issue_id,
+                issue_message(
+                    network, "relayer_slow_inclusion_resolved", network.relayer_address
+                ),
+            )
+
+
+def check_https_endpoints(network: Network) -> bool:
+    """Check the health of the network HTTPS endpoints.
+
+    Returns whether the primary endpoint, used by the RPC checks, is up.
+    """
+    primary_succeeded = False
+    for endpoint in network.https_rpc_urls:
+        issue_id = generate_issue_id(network, endpoint, "idchain https endpoint")
         issue_exists = is_issue_exists(issue_id)
         block_number_hex = send_rpc_request(
             url=endpoint,
             method="eth_blockNumber",
             params=[],
         )
-        if not block_number_hex:
-            return False
+        try:
+            succeeded = int(block_number_hex, 16) > 0 if block_number_hex else False
+        except (ValueError, TypeError) as e:
+            logging.error(f"Invalid block number from {endpoint}: {block_number_hex}. {e}")
+            succeeded = False
+        if endpoint == network.https_rpc_urls[0]:
+            primary_succeeded = succeeded
 
-        succeeded = int(block_number_hex, 16) > 0 if block_number_hex else False
         if not succeeded and not issue_exists:
             insert_new_issue(
                 issue_id,
-                ISSUE_MESSAGES["https_endpoint_down"].format(endpoint),
+                issue_message(network, "https_endpoint_down", endpoint),
             )
         elif succeeded and issue_exists:
             mark_issue_resolved(
                 issue_id,
-                ISSUE_MESSAGES["https_endpoint_resolved"].format(endpoint),
+                issue_message(network, "https_endpoint_resolved", endpoint),
             )
-    return True
+    return primary_succeeded
 
 
-def check_wss_endpoints() -> bool:
-    """Check the health of IDChain WSS endpoints."""
-    for endpoint in config.WSS_RPC_URLS:
-        issue_id = generate_issue_id(endpoint, "idchain wss endpoint")
+def check_wss_endpoints(network: Network) -> bool:
+    """Check the health of the network WSS endpoints."""
+    # websocket-client is only needed here, load it when first used
+    import websocket
+
+    for endpoint in network.wss_rpc_urls:
+        issue_id = generate_issue_id(network, endpoint, "idchain wss endpoint")
         issue_exists = is_issue_exists(issue_id)
         succeeded = False
         ws = websocket.WebSocket()
         try:
-            ws.connect(endpoint, timeout=30)
+            ws.connect(endpoint, timeout=REQUEST_TIMEOUT)
             succeeded = ws.connected
         except Exception as e:
             logging.error(f"Failed to connect to WebSocket {endpoint}: {e}")
@@ -277,127 +550,164 @@ def check_wss_endpoints() -> bool:
         if not succeeded and not issue_exists:
             insert_new_issue(
                 issue_id,
-                ISSUE_MESSAGES["wss_endpoint_down"].format(endpoint),
+                issue_message(network, "wss_endpoint_down", endpoint),
             )
         elif succeeded and issue_exists:
             mark_issue_resolved(
                 issue_id,
-                ISSUE_MESSAGES["wss_endpoint_resolved"].format(endpoint),
+                issue_message(network, "wss_endpoint_resolved", endpoint),
             )
     return True
 
 
-def check_idchain_explorer_service() -> None:
-    """Check the health of the IDChain explorer service."""
+def check_idchain_explorer_service(network: Network) -> None:
+    """Check the health of the network explorer service."""
+    if not network.explorer_url:
+        return
+
     issue_id = generate_issue_id(
-        config.IDCHAIN_EXPLORER_URL, "idchain explorer service"
+        network, network.explorer_url, "idchain explorer service"
     )
     issue_exists = is_issue_exists(issue_id)
     try:
-        response = requests.get(config.IDCHAIN_EXPLORER_URL)
+        response = session.get(network.explorer_url, timeout=REQUEST_TIMEOUT)
         succeeded = response is not None and response.status_code == 200
     except requests.exceptions.RequestException as e:
-        logging.error(f"Failed to check IDChain explorer service: {e}")
+        logging.error(f"Failed to check {network.name} explorer service: {e}")
         succeeded = False
     if not succeeded and not issue_exists:
         insert_new_issue(
             issue_id,
-            ISSUE_MESSAGES["explorer_service_down"].format(config.IDCHAIN_EXPLORER_URL),
+            issue_message(network, "explorer_service_down", network.explorer_url),
         )
     elif succeeded and issue_exists:
         mark_issue_resolved(
             issue_id,
-            ISSUE_MESSAGES["explorer_service_resolved"].format(
-                config.IDCHAIN_EXPLORER_URL
-            ),
+            issue_message(network, "explorer_service_resolved", network.explorer_url),
         )
 
 
-def check_idchain_aragon_service() -> None:
-    """Check the health of the IDChain Aragon service."""
-    issue_id = generate_issue_id(config.IDCHAIN_ARAGON_URL, "idchain aragon service")
+def check_idchain_aragon_service(network: Network) -> None:
+    """Check the health of the network Aragon service."""
+    if not network.aragon_url:
+        return
+
+    issue_id = generate_issue_id(network, network.aragon_url, "idchain aragon service")
     issue_exists = is_issue_exists(issue_id)
     try:
-        response = requests.get(config.IDCHAIN_ARAGON_URL)
+        response = session.get(network.aragon_url, timeout=REQUEST_TIMEOUT)
         succeeded = response is not None and response.status_code == 200
     except requests.exceptions.RequestException as e:
-        logging.error(f"Failed to check IDChain Aragon service: {e}")
+        logging.error(f"Failed to check {network.name} Aragon service: {e}")
         succeeded = False
     if not succeeded and not issue_exists:
         insert_new_issue(
             issue_id,
-            ISSUE_MESSAGES["aragon_service_down"].format(config.IDCHAIN_ARAGON_URL),
+            issue_message(network, "aragon_service_down", network.aragon_url),
         )
     elif succeeded and issue_exists:
         mark_issue_resolved(
             issue_id,
-            ISSUE_MESSAGES["aragon_service_resolved"].format(config.IDCHAIN_ARAGON_URL),
+            issue_message(network, "aragon_service_resolved", network.aragon_url),
         )
 
 
-def check_eidi_claim_page() -> None:
+def check_eidi_claim_page(network: Network) -> None:
     """Check the health of the claim Eidi Page."""
-    issue_id = generate_issue_id(config.EIDI_CLAIM_URL, "claim eidi page")
+    if not network.eidi_claim_url:
+        return
+
+    issue_id = generate_issue_id(network, network.eidi_claim_url, "claim eidi page")
     issue_exists = is_issue_exists(issue_id)
     try:
-        response = requests.get(config.EIDI_CLAIM_URL)
+        response = session.get(network.eidi_claim_url, timeout=REQUEST_TIMEOUT)
         succeeded = response is not None and response.status_code == 200
     except requests.exceptions.RequestException as e:
-        logging.error(f"Failed to check Eidi claim page: {e}")
+        logging.error(f"Failed to check {network.name} Eidi claim page: {e}")
         succeeded = False
     if not succeeded and not issue_exists:
         insert_new_issue(
             issue_id,
-            ISSUE_MESSAGES["claim_page_down"].format(config.EIDI_CLAIM_URL),
+            issue_message(network, "claim_page_down", network.eidi_claim_url),
         )
     elif succeeded and issue_exists:
         mark_issue_resolved(
             issue_id,
-            ISSUE_MESSAGES["claim_page_resolved"].format(config.EIDI_CLAIM_URL),
+            issue_message(network, "claim_page_resolved", network.eidi_claim_url),
         )
 
 
-def check_eidi_claim_api() -> None:
+def check_eidi_claim_api(network: Network) -> None:
     """Check the health of the claim Eidi API."""
-    issue_id = generate_issue_id(config.EIDI_CLAIM_API, "idchain relayer service")
+    if not network.eidi_claim_api:
+        return
+
+    issue_id = generate_issue_id(network, network.eidi_claim_api, "idchain relayer service")
     issue_exists = is_issue_exists(issue_id)
     request_data = {"addr": "0x79af508c9698076bc1c2dfa224f7829e9768b11e"}
-    response = send_post_request(config.EIDI_CLAIM_API, request_data)
+    response = send_post_request(network.eidi_claim_api, request_data)
     succeeded = response is not None and response.status_code == 200
     if not succeeded and not issue_exists:
         insert_new_issue(
             issue_id,
-            ISSUE_MESSAGES["claim_api_down"].format(config.EIDI_CLAIM_API),
+            issue_message(network, "claim_api_down", network.eidi_claim_api),
         )
     elif succeeded and issue_exists:
         mark_issue_resolved(
-            issue_id, ISSUE_MESSAGES["claim_api_resolved"].format(config.EIDI_CLAIM_API)
+            issue_id,
+            issue_message(network, "claim_api_resolved", network.eidi_claim_api),
         )
 
 
+def check_network(network: Network) -> None:
+    """Run all checks of a network."""
+    try:
+        primary_rpc_up = check_https_endpoints(network)
+        check_wss_endpoints(network)
+        check_eidi_claim_page(network)
+        check_eidi_claim_api(network)
+        check_idchain_explorer_service(network)
+        check_idchain_aragon_service(network)
+        # The primary endpoint issue is open, skip the checks that depend on it
+        if not primary_rpc_up:
+            logging.error(f"Primary RPC of {network.name} is down, skipping its RPC checks")
+            return
+        check_idchain_lock(network)
+        check_sealers_activity(network)
+        check_relayer_balance(network)
+        check_relayer_nonce(network)
+        check_txpool_backlog(network)
+        check_distributor_balance(network)
+    except Exception as e:
+        logging.error(f"Error in monitor_service on {network.name}: {e}")
+        logging.error(traceback.format_exc())
+
+
 def main() -> None:
-    """Continuously monitor the health of IDChain services."""
+    """Continuously monitor the health of the services of all networks."""
+    global first_check_done
+    if not ready.wait(WARM_UP_TIMEOUT):
+        logging.warning("Warm-up is taking too long, starting checks anyway")
     while True:
         try:
-            check_https_endpoints()
-            check_idchain_lock()
-            check_wss_endpoints()
-            check_sealers_activity()
-            check_eidi_claim_page()
-            check_eidi_claim_api()
-            check_idchain_explorer_service()
-            check_idchain_aragon_service()
-            check_relayer_balance()
-            check_distributor_balance()
+            load_issues()
+            list(network_executor.map(check_network, config.NETWORKS))
             update_health_status()
+            if not first_check_done:
+                first_check_done = True
+                report_startup("time_to_first_check")
         except Exception as e:
             logging.error(f"Error in monitor_service: {e}")
             logging.error(traceback.format_exc())
+            redis_pipeline.reset()
 
         time.sleep(config.CHECK_INTERVAL)
 
 
 if __name__ == "__main__":
-    logging.info("Starting Monitor Service...")
+    logging.info(
+        f"Starting Monitor Service for {', '.join(n.name for n in config.NETWORKS)}..."
+    )
+    Thread(target=warm_up, daemon=True).start()
     monitor_thread = Thread(target=main)
     monitor_thread.start()
@@ -18,6 +18,7 @@ redis_client = redis.Redis(
 SERVICES = ["monitor_service", "alert_service"]
 docker_client = docker.from_env()
 watchdog_start_time = int(time.time())
+restarted_at = {}
 
 
 def get_last_check(service_name: str) -> int:
@@ -32,6 +33,7 @@ def restart_service(service_name: str):
         container = docker_client.containers.get(f"idchain-alert-{service_name}-1")
         logging.warning(f"{service_name} is unresponsive! Restarting...")
         container.restart()
+        restarted_at[service_name] = int(time.time())
         logging.info(f"{service_name} restarted successfully.")
     except Exception as e:
         logging.error(f"Failed to restart {service_name}: {e}")
@@ -46,7 +48,8 @@ def watchdog():
             if current_time - watchdog_start_time < config.WATCHDOG_THRESHOLD:
                 continue
 
-            last_check = get_last_check(service)
+            # A restarted service is given the same grace period to warm up
+            last_check = max(get_last_check(service), restarted_at.get(service, 0))
             if current_time - last_check > config.WATCHDOG_THRESHOLD:
                 restart_service(service)
         time.sleep(config.CHECK_INTERVAL * 3)